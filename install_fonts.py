@@ -6,33 +6,94 @@ Run this script to install FiraCode fonts to your system
 
 import sys
 import os
-sys.path.append('src')
+import importlib.util
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Font directories named in the manual installation instructions
+SYSTEM_FONT_DIRS = (
+    "C:/Windows/Fonts/",
+    os.path.expanduser("~/Library/Fonts/"),
+    os.path.expanduser("~/.local/share/fonts/"),
+)
+
+_MENU_TEXT = (
+    "\n" + "=" * 50 + "\n"
+    "Installation Options:\n"
+    "0. Show current font status\n"
+    "1. Attempt automatic installation (may require admin rights)\n"
+    "2. Show manual installation instructions\n"
+    "3. Test current font setup\n"
+    "4. Exit\n"
+)
+
+_MANUAL_INSTRUCTIONS = (
+    "\n📋 Manual Installation Instructions:\n"
+    + "=" * 40 + "\n"
+    "1. Navigate to the 'fonts' directory in this project\n"
+    "2. Find 'FiraCode-Regular.ttf' file\n"
+    "3. Right-click on the font file\n"
+    "4. Select 'Install' or 'Install for all users'\n"
+    "5. Restart the application\n"
+    "\nAlternatively:\n"
+    "- Copy FiraCode-Regular.ttf to C:/Windows/Fonts/ (Windows)\n"
+    "- Copy to ~/Library/Fonts/ (macOS)\n"
+    "- Copy to ~/.local/share/fonts/ (Linux)\n"
+)
+
+def _firacode_present_fast():
+    """Check for a FiraCode*.ttf file by name only, without parsing any fonts"""
+    for fonts_dir in SYSTEM_FONT_DIRS:
+        try:
+            with os.scandir(fonts_dir) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.startswith('firacode') and name.endswith('.ttf') and entry.is_file():
+                        return True
+        except OSError:
+            continue
+    return False
+
+# FiraCode file names looked for in the project fonts directory
+PROJECT_FIRACODE_FILES = ("FiraCode-Regular.ttf", "FiraCode.ttf", "firacode-regular.ttf")
+
+def _project_firacode_available():
+    """Check that a FiraCode file exists in the project fonts directory (installs nothing)"""
+    from font_installer import get_project_fonts_dir
+    fonts_dir = get_project_fonts_dir()
+    return any(os.path.isfile(os.path.join(fonts_dir, name)) for name in PROJECT_FIRACODE_FILES)
 
 def main():
     print("FiraCode Font Installer")
     print("=" * 30)
     
     try:
-        from font_installer import ensure_firacode_available, print_font_status
+        # Warm the import system's finder caches for the option-3 import
+        importlib.util.find_spec('barcode_mode')
         
-        # Show current status
-        print("Current Font Status:")
-        print_font_status()
+        if _firacode_present_fast():
+            print("✓ FiraCode found in system fonts")
+        else:
+            print("- FiraCode not found in system fonts (select 0 for details)")
         
         # Ask user for installation
-        print("\n" + "=" * 50)
-        print("Installation Options:")
-        print("1. Attempt automatic installation (may require admin rights)")
-        print("2. Show manual installation instructions")
-        print("3. Test current font setup")
-        print("4. Exit")
+        sys.stdout.write(_MENU_TEXT)
         
         while True:
             try:
-                choice = input("\nSelect option (1-4): ").strip()
+                choice = input("\nSelect option (0-4): ").strip()
+                
+                if choice == "0":
+                    from font_installer import print_font_status
+                    
+                    print("\nCurrent Font Status:")
+                    print_font_status()
                 
-                if choice == "1":
+                elif choice == "1":
                     print("\nAttempting automatic installation...")
+                    from font_installer import ensure_firacode_available
                     result = ensure_firacode_available(silent=False)
                     
                     if result['installation_success']:
@@ -48,25 +109,19 @@ def main():
                     break
                 
                 elif choice == "2":
-                    print("\n📋 Manual Installation Instructions:")
-                    print("=" * 40)
-                    print("1. Navigate to the 'fonts' directory in this project")
-                    print("2. Find 'FiraCode-Regular.ttf' file")
-                    print("3. Right-click on the font file")
-                    print("4. Select 'Install' or 'Install for all users'")
-                    print("5. Restart the application")
-                    print("\nAlternatively:")
-                    print("- Copy FiraCode-Regular.ttf to C:/Windows/Fonts/ (Windows)")
-                    print("- Copy to ~/Library/Fonts/ (macOS)")
-                    print("- Copy to ~/.local/share/fonts/ (Linux)")
+                    sys.stdout.write(_MANUAL_INSTRUCTIONS)
                     break
                 
                 elif choice == "3":
                     print("\nTesting font setup...")
                     
+                    if not _project_firacode_available():
+                        print("❌ FiraCode not found in project directory.")
+                        print("Please ensure fonts/FiraCode-Regular.ttf exists.")
+                        break
+                    
                     # Test font loading
                     try:
-                        sys.path.append('src')
                         from barcode_mode import encode, save_barcode_image
                         
                         # Create test barcode
@@ -94,7 +149,7 @@ def main():
                     break
                 
                 else:
-                    print("Invalid choice. Please enter 1-4.")
+                    print("Invalid choice. Please enter 0-4.")
             
             except KeyboardInterrupt:
                 print("\n\nExiting...")
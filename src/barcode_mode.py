@@ -3,6 +3,9 @@ import barcode
 from barcode.writer import ImageWriter
 import io
 import os
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from pyzbar import pyzbar
 
@@ -13,6 +16,253 @@ try:
 except ImportError:
     pass
 
+# Prefixes of the encoded string: BARCODE2 carries the PNG as base64,
+# the legacy BARCODE form (still decoded) carries it as hex
+BARCODE_PREFIX = "BARCODE2:"
+LEGACY_BARCODE_PREFIX = "BARCODE:"
+# Largest image accepted when decoding an encoded barcode string
+MAX_IMAGE_BYTES = 16 * 1024 * 1024
+# Separates the image data from the preserved original text
+_ORIGINAL_MARKER = ":ORIGINAL:"
+
+# Barcode type name -> python-barcode class
+_BARCODE_CLASSES = {
+    'code128': barcode.Code128,
+    'code39': barcode.Code39,
+    'ean8': barcode.EAN8,
+    'ean13': barcode.EAN13,
+    'jan': barcode.JAN,
+    'isbn10': barcode.ISBN10,
+    'isbn13': barcode.ISBN13,
+    'issn': barcode.ISSN,
+    'upca': barcode.UPCA,
+    'pzn': barcode.PZN
+}
+
+# Numeric barcode types whose input may contain '-'/' ' formatting characters
+_NUMERIC_TYPES = frozenset({'ean8', 'ean13', 'jan', 'upca', 'isbn10', 'isbn13', 'issn', 'pzn'})
+# Translation table deleting those formatting characters in a single pass
+_STRIP_FORMATTING = str.maketrans('', '', '- ')
+
+# os.open flags for saving images (O_BINARY keeps Windows from translating newlines)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Example input per barcode type (shown as placeholder text)
+_BARCODE_EXAMPLES = {
+    'code128': 'Hello World!',      # Can handle mixed text
+    'code39': 'HELLO123',           # Uppercase + numbers
+    'ean8': '1234567',              # 7 digits only
+    'ean13': '123456789012',        # 12 digits only  
+    'upc_a': '12345678901',         # 11 digits only
+    'isbn': '9781234567897',        # 13 digits starting with 978/979
+    'issn': '12345678',             # 8 digits with dash: 1234-5678
+    'pzn': '123456'                 # 6-7 digits
+}
+
+# Tooltip describing the accepted input per barcode type
+_BARCODE_TOOLTIPS = {
+    'code128': 'CODE128 - Most flexible\n• Supports: All ASCII characters (letters, numbers, symbols)\n• Examples: "Hello World!", "ABC-123", "2024/08/22"\n• Cannot use: Unicode characters (Vietnamese, emojis)',
+
+    'code39': 'CODE39 - Limited character set\n• Supports: A-Z (uppercase only), 0-9, space\n• Special chars: - . $ / + % *\n• Examples: "HELLO123", "ABC-456", "TEST$123"\n• Cannot use: lowercase letters, other symbols',
+
+    'ean8': 'EAN-8 - Product barcode (8 digits)\n• Supports: Exactly 7 numbers (8th is auto-calculated)\n• Examples: "1234567", "9876543"\n• Cannot use: Letters, symbols, wrong length',
+
+    'ean13': 'EAN-13 - International product barcode\n• Supports: Exactly 12 numbers (13th is auto-calculated)\n• Examples: "123456789012", "978123456789"\n• Cannot use: Letters, symbols, wrong length',
+
+    'upca': 'UPC-A - North American product barcode\n• Supports: Exactly 11 numbers (12th is auto-calculated)\n• Examples: "01234567890", "12345678901"\n• Cannot use: Letters, symbols, wrong length',
+
+    'isbn10': 'ISBN-10 - Book identifier (old format)\n• Supports: 9 digits + 1 check digit (can be X)\n• Examples: "0123456789", "012345678X"\n• Format: First 9 must be digits, last can be digit or X',
+
+    'isbn13': 'ISBN-13 - Book identifier (new format)\n• Supports: Exactly 13 digits (usually starts with 978/979)\n• Examples: "9780123456789", "9791234567890"\n• Cannot use: Letters, symbols, wrong length',
+
+    'issn': 'ISSN - Serial publication identifier\n• Supports: 7 digits + 1 check digit (can be X)\n• Examples: "12345678", "1234567X", "1234-5678"\n• Format: XXXXXXXX or XXXX-XXXX',
+
+    'pzn': 'PZN - German pharmaceutical code\n• Supports: 6 or 7 digits only\n• Examples: "123456" (6 digits), "1234567" (7 digits)\n• Cannot use: Letters, symbols, other lengths'
+}
+
+# Characters Code39 can encode
+_CODE39_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -.$/+%*')
+
+# Project fonts directory (resolved once at import)
+_FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts")
+
+# Fonts tried in order for custom barcode text
+_FONT_PATHS = (
+    # FiraCode in project fonts directory (highest priority)
+    os.path.join(_FONTS_DIR, "FiraCode-Regular.ttf"),
+    os.path.join(_FONTS_DIR, "FiraCode.ttf"),
+    os.path.join(_FONTS_DIR, "firacode-regular.ttf"),
+    # FiraCode system installations
+    "FiraCode-Regular.ttf",
+    "C:/Windows/Fonts/FiraCode-Regular.ttf",
+    f"C:/Users/{os.environ.get('USERNAME', 'user')}/AppData/Local/Microsoft/Windows/Fonts/FiraCode-Regular.ttf",
+    "FiraCode.ttf",
+    "C:/Windows/Fonts/FiraCode.ttf",
+    "firacode",
+    # Consolas (excellent monospace font on Windows)
+    "C:/Windows/Fonts/consola.ttf",
+    "consolas.ttf",
+    "C:/Windows/Fonts/consolab.ttf",  # Bold version
+    # Courier New (classic monospace)
+    "C:/Windows/Fonts/cour.ttf",
+    "C:/Windows/Fonts/courbd.ttf",
+    "courier.ttf",
+    # DejaVu Sans Mono (good cross-platform option)
+    "DejaVuSansMono.ttf",
+    "DejaVuSansMono-Bold.ttf",
+    # Arial fallbacks
+    "C:/Windows/Fonts/arial.ttf",
+    "arial.ttf"
+)
+
+@lru_cache(maxsize=32)
+def _load_font(font_size: int):
+    """
+    Load the first available font from _FONT_PATHS, cached per size.
+    
+    :param font_size: Font size in points
+    :return: PIL font object (PIL's default font if none of the candidates load)
+    """
+    for font_path in _FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except OSError:
+            continue
+    
+    # Final fallback to default font
+    return ImageFont.load_default()
+
+@lru_cache(maxsize=64)
+def _text_mask(text: str, font_size: int):
+    """
+    Rasterize a caption once per (text, font size) for pasting under barcodes.
+    
+    :param text: Caption text
+    :param font_size: Font size in points
+    :return: Tuple of (8-bit coverage mask of the ink, ink bbox relative to the text origin)
+    """
+    font = _load_font(font_size)
+    bbox = font.getbbox(text)
+    mask = Image.new('L', (max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+    return mask, bbox
+
+class _BarImageWriter(ImageWriter):
+    """ImageWriter that only paints bars; the canvas is created filled with the background."""
+    
+    def _paint_module(self, xpos, ypos, width, color):
+        # Spaces would repaint background over background, one rectangle each
+        if color != self.background:
+            super()._paint_module(xpos, ypos, width, color)
+
+def _build_writer(options: dict) -> ImageWriter:
+    """
+    Create an ImageWriter configured with the given options.
+    
+    :param options: ImageWriter options (module_width, module_height, quiet_zone, ...)
+    :return: Configured ImageWriter
+    """
+    writer = _BarImageWriter()
+    writer.set_options(options)
+    return writer
+
+def _render_with_custom_text(barcode_img, custom_text_content: str, font_size: int, text_distance: float):
+    """
+    Draw custom text centered below a rendered barcode.
+    
+    :param barcode_img: PIL image of the barcode rendered without text
+    :param custom_text_content: Text to draw under the bars
+    :param font_size: Font size in points
+    :param text_distance: Gap between the bars and the text
+    :return: New PIL image of the barcode with the custom text
+    """
+    # Create a new image with extra space for custom text
+    img_width, img_height = barcode_img.size
+    text_height = int(font_size + text_distance + 10)  # Extra padding, convert to int
+    new_height = int(img_height + text_height)  # Convert to int
+    new_img = Image.new('RGB', (img_width, new_height), 'white')
+    
+    # Paste the original barcode
+    new_img.paste(barcode_img, (0, 0))
+    
+    # Add custom text from the cached rasterized caption
+    mask, bbox = _text_mask(custom_text_content, font_size)
+    
+    # Calculate text position (centered)
+    text_width = bbox[2] - bbox[0]
+    text_x = (img_width - text_width) // 2
+    text_y = int(img_height + text_distance)  # Convert to int
+    
+    # Same placement as draw.text((text_x, text_y), ...): ink starts at the bbox offset
+    new_img.paste((0, 0, 0), (text_x + bbox[0], text_y + bbox[1]), mask)
+    return new_img
+
+def _payload_to_bytes(tag: str, declared: int, payload: str):
+    """
+    Convert the image field of an encoded barcode string back to PNG bytes.
+    
+    :param tag: Prefix without the colon ('BARCODE2' or legacy 'BARCODE')
+    :param declared: Byte count from the length field
+    :param payload: Base64 (BARCODE2) or hex (BARCODE) image data
+    :return: PNG image bytes, or None if the data is invalid or does not match the declared length
+    """
+    try:
+        if tag == BARCODE_PREFIX[:-1]:
+            image_data = base64.b64decode(payload, validate=True)
+        else:
+            image_data = bytes.fromhex(payload)
+    except ValueError:  # binascii.Error is a ValueError subclass
+        return None
+    if len(image_data) != declared:
+        return None
+    return image_data
+
+def _image_field(text: str):
+    """
+    Locate and sanity-check the image field of an encoded barcode string without splitting the whole string.
+    
+    :param text: Special format string (TAG:length:data[:ORIGINAL:original_text])
+    :return: (tag, declared_length, data) tuple, or None if the string is malformed
+    """
+    tag_end = text.find(':')
+    if tag_end == -1:
+        return None
+    data_start = text.find(':', tag_end + 1) + 1
+    if data_start == 0:
+        return None
+    # Base64 and hex never contain ':', so the field ends at the next colon
+    data_end = text.find(':', data_start)
+    if data_end == -1:
+        data_end = len(text)
+    
+    # Check the declared byte count against the field length before decoding anything
+    length_field = text[tag_end + 1:data_start - 1]
+    if not (length_field.isascii() and length_field.isdecimal()):  # isdigit() accepts '²', which int() rejects
+        return None
+    declared = int(length_field)
+    tag = text[:tag_end]
+    if tag == BARCODE_PREFIX[:-1]:
+        expected = 4 * ((declared + 2) // 3)  # Padded base64
+    else:
+        expected = 2 * declared  # Hex
+    if declared > MAX_IMAGE_BYTES or data_end - data_start != expected:
+        return None
+    return tag, declared, text[data_start:data_end]
+
+def format_barcode_image(png_data: bytes, original_text: str = None) -> str:
+    """
+    Wrap PNG image bytes in the special barcode format string.
+    
+    :param png_data: PNG image bytes (or any bytes-like buffer)
+    :param original_text: Text to preserve for decoding, if known
+    :return: Special format string accepted by decode()
+    """
+    text = f"{BARCODE_PREFIX}{len(png_data)}:{base64.b64encode(png_data).decode('ascii')}"
+    if original_text is not None:
+        text += f"{_ORIGINAL_MARKER}{original_text}"
+    return text
+
+@lru_cache(maxsize=512)
 def get_barcode_example_text(barcode_type: str) -> str:
     """
     Get appropriate example text for each barcode type.
@@ -26,19 +276,9 @@ def get_barcode_example_text(barcode_type: str) -> str:
     
     barcode_type = barcode_type.lower()
     
-    examples = {
-        'code128': 'Hello World!',      # Can handle mixed text
-        'code39': 'HELLO123',           # Uppercase + numbers
-        'ean8': '1234567',              # 7 digits only
-        'ean13': '123456789012',        # 12 digits only  
-        'upc_a': '12345678901',         # 11 digits only
-        'isbn': '9781234567897',        # 13 digits starting with 978/979
-        'issn': '12345678',             # 8 digits with dash: 1234-5678
-        'pzn': '123456'                 # 6-7 digits
-    }
-    
-    return examples.get(barcode_type, 'Hello World!')  # Default fallback
+    return _BARCODE_EXAMPLES.get(barcode_type, 'Hello World!')  # Default fallback
 
+@lru_cache(maxsize=512)
 def get_barcode_tooltip_text(barcode_type: str) -> str:
     """
     Get detailed tooltip text explaining what strings this barcode type can handle.
@@ -52,28 +292,9 @@ def get_barcode_tooltip_text(barcode_type: str) -> str:
         
     barcode_type = barcode_type.lower()
     
-    tooltips = {
-        'code128': 'CODE128 - Most flexible\n• Supports: All ASCII characters (letters, numbers, symbols)\n• Examples: "Hello World!", "ABC-123", "2024/08/22"\n• Cannot use: Unicode characters (Vietnamese, emojis)',
-        
-        'code39': 'CODE39 - Limited character set\n• Supports: A-Z (uppercase only), 0-9, space\n• Special chars: - . $ / + % *\n• Examples: "HELLO123", "ABC-456", "TEST$123"\n• Cannot use: lowercase letters, other symbols',
-        
-        'ean8': 'EAN-8 - Product barcode (8 digits)\n• Supports: Exactly 7 numbers (8th is auto-calculated)\n• Examples: "1234567", "9876543"\n• Cannot use: Letters, symbols, wrong length',
-        
-        'ean13': 'EAN-13 - International product barcode\n• Supports: Exactly 12 numbers (13th is auto-calculated)\n• Examples: "123456789012", "978123456789"\n• Cannot use: Letters, symbols, wrong length',
-        
-        'upca': 'UPC-A - North American product barcode\n• Supports: Exactly 11 numbers (12th is auto-calculated)\n• Examples: "01234567890", "12345678901"\n• Cannot use: Letters, symbols, wrong length',
-        
-        'isbn10': 'ISBN-10 - Book identifier (old format)\n• Supports: 9 digits + 1 check digit (can be X)\n• Examples: "0123456789", "012345678X"\n• Format: First 9 must be digits, last can be digit or X',
-        
-        'isbn13': 'ISBN-13 - Book identifier (new format)\n• Supports: Exactly 13 digits (usually starts with 978/979)\n• Examples: "9780123456789", "9791234567890"\n• Cannot use: Letters, symbols, wrong length',
-        
-        'issn': 'ISSN - Serial publication identifier\n• Supports: 7 digits + 1 check digit (can be X)\n• Examples: "12345678", "1234567X", "1234-5678"\n• Format: XXXXXXXX or XXXX-XXXX',
-        
-        'pzn': 'PZN - German pharmaceutical code\n• Supports: 6 or 7 digits only\n• Examples: "123456" (6 digits), "1234567" (7 digits)\n• Cannot use: Letters, symbols, other lengths'
-    }
-    
-    return tooltips.get(barcode_type, 'Unknown barcode type')
+    return _BARCODE_TOOLTIPS.get(barcode_type, 'Unknown barcode type')
 
+@lru_cache(maxsize=4096)
 def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     """
     Validate if data is compatible with the specified barcode type.
@@ -94,16 +315,15 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'code39':
         # Code39 accepts: A-Z, 0-9, space, and special chars: - . $ / + % *
-        valid_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -.$/+%*')
         data_upper = data.upper()
-        invalid_chars = set(data_upper) - valid_chars
+        invalid_chars = set(data_upper) - _CODE39_CHARS
         if invalid_chars:
             return False, f"Code39 only supports: A-Z, 0-9, space and special characters: - . $ / + % *\nInvalid characters: {', '.join(invalid_chars)}\nValid examples: 'HELLO123', 'ABC-456', 'TEST$123'"
         return True, ""
     
     elif barcode_type in ['ean8']:
         # EAN-8 requires exactly 7 digits (8th is check digit)
-        clean_data = data.replace('-', '').replace(' ', '')
+        clean_data = data.translate(_STRIP_FORMATTING)
         if not clean_data.isdigit():
             non_digit_chars = [c for c in clean_data if not c.isdigit()]
             return False, f"EAN-8 only accepts numbers.\nInvalid characters: {', '.join(non_digit_chars)}\nValid examples: '1234567', '9876543'"
@@ -116,7 +336,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type in ['ean13', 'jan']:
         # EAN-13/JAN requires exactly 12 digits (13th is check digit)
-        clean_data = data.replace('-', '').replace(' ', '')
+        clean_data = data.translate(_STRIP_FORMATTING)
         if not clean_data.isdigit():
             non_digit_chars = [c for c in clean_data if not c.isdigit()]
             return False, f"EAN-13/JAN only accepts numbers.\nInvalid characters: {', '.join(non_digit_chars)}\nValid examples: '123456789012', '978123456789'"
@@ -129,7 +349,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'upca':
         # UPC-A requires exactly 11 digits (12th is check digit)
-        clean_data = data.replace('-', '').replace(' ', '')
+        clean_data = data.translate(_STRIP_FORMATTING)
         if not clean_data.isdigit():
             return False, "UPC-A only accepts numbers.\nValid examples: '01234567890', '12345678901'"
         if len(clean_data) != 11:
@@ -138,7 +358,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'isbn10':
         # ISBN-10: 9 digits + check digit (can be X)
-        clean_data = data.replace('-', '').replace(' ', '').upper()
+        clean_data = data.translate(_STRIP_FORMATTING).upper()
         if len(clean_data) != 10:
             return False, f"ISBN-10 requires exactly 10 characters (current: {len(clean_data)} characters).\nValid examples: '0123456789', '012345678X'"
         # First 9 must be digits, last can be digit or X
@@ -150,7 +370,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'isbn13':
         # ISBN-13: 13 digits (usually starts with 978 or 979)
-        clean_data = data.replace('-', '').replace(' ', '')
+        clean_data = data.translate(_STRIP_FORMATTING)
         if not clean_data.isdigit():
             return False, "ISBN-13 only accepts numbers.\nValid examples: '9780123456789', '9791234567890'"
         if len(clean_data) != 13:
@@ -159,7 +379,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'issn':
         # ISSN: 8 digits with format XXXX-XXXX
-        clean_data = data.replace('-', '').replace(' ', '').upper()
+        clean_data = data.translate(_STRIP_FORMATTING).upper()
         if len(clean_data) != 8:
             return False, f"ISSN requires exactly 8 characters (current: {len(clean_data)} characters).\nValid examples: '12345678', '1234567X', '1234-5678'"
         # First 7 must be digits, last can be digit or X
@@ -171,7 +391,7 @@ def validate_barcode_data(data: str, barcode_type: str) -> tuple[bool, str]:
     
     elif barcode_type == 'pzn':
         # PZN: 6 or 7 digits
-        clean_data = data.replace('-', '').replace(' ', '')
+        clean_data = data.translate(_STRIP_FORMATTING)
         if not clean_data.isdigit():
             return False, "PZN only accepts numbers.\nValid examples: '123456' (6 digits), '1234567' (7 digits)"
         if len(clean_data) not in [6, 7]:
@@ -193,19 +413,46 @@ def encode(data, encoding: str = "utf-8", **kwargs) -> str:
     :param **kwargs: Additional options (barcode_type, module_width, module_height, quiet_zone, text_distance, custom_text_content, hide_text)
     :return: A special format string containing barcode image data
     """
-    # Convert data to string if needed
-    if isinstance(data, bytes):
-        try:
-            # Try to decode the bytes to string 
-            text = data.decode(encoding, errors="replace")
-        except UnicodeDecodeError:
-            # If fails, use hex representation
-            text = data.hex()
-    else:
-        text = str(data)
+    # Identical requests (e.g. preview redraws) reuse the previously rendered barcode
+    options = tuple(sorted(kwargs.items()))
+    try:
+        hash((data, options))
+    except TypeError:
+        # Unhashable data or option values cannot be cached
+        return compile_encoder(**kwargs)(data, encoding)
+    return _encode_cached(data, encoding, options)
+
+@lru_cache(maxsize=128, typed=True)
+def _encode_cached(data, encoding: str, options: tuple) -> str:
+    """
+    Cached encode() keyed by data, encoding and the sorted option items.
     
+    :param data: Text content (string or bytes) to encode in barcode
+    :param encoding: String encoding if data is bytes
+    :param options: Sorted (name, value) pairs of encode() options
+    :return: A special format string containing barcode image data
+    """
+    return _get_encoder(options)(data, encoding)
+
+@lru_cache(maxsize=16, typed=True)
+def _get_encoder(options: tuple):
+    """
+    Cached compile_encoder() keyed by the sorted option items.
+    
+    :param options: Sorted (name, value) pairs of encode() options
+    :return: Encoder function, see compile_encoder()
+    """
+    return compile_encoder(**dict(options))
+
+def compile_encoder(**kwargs):
+    """
+    Resolve the option-dependent part of encode() once and return a function for the per-data part.
+    
+    :param **kwargs: Same options as encode()
+    :return: Function run(data, encoding="utf-8") -> special format string
+    """
     # Get options from kwargs
-    barcode_type = kwargs.get('barcode_type', 'code128')
+    barcode_type = kwargs.get('barcode_type', 'code128').lower()
     module_width = kwargs.get('module_width', 0.2)
     module_height = kwargs.get('module_height', 15.0)
     quiet_zone = kwargs.get('quiet_zone', 6.5)
@@ -214,171 +461,89 @@ def encode(data, encoding: str = "utf-8", **kwargs) -> str:
     custom_text_content = kwargs.get('custom_text_content', '')
     hide_text = kwargs.get('hide_text', False)
     
-    # Validate data against barcode type
-    is_valid, error_message = validate_barcode_data(text, barcode_type)
-    if not is_valid:
-        raise ValueError(f"Data is not compatible with barcode type {barcode_type.upper()}:\n\n{error_message}")
-    
-    # Map barcode types to available classes
-    barcode_classes = {
-        'code128': barcode.Code128,
-        'code39': barcode.Code39,
-        'ean8': barcode.EAN8,
-        'ean13': barcode.EAN13,
-        'jan': barcode.JAN,
-        'isbn10': barcode.ISBN10,
-        'isbn13': barcode.ISBN13,
-        'issn': barcode.ISSN,
-        'upca': barcode.UPCA,
-        'pzn': barcode.PZN
-    }
-    
     # Get the barcode class
-    barcode_class = barcode_classes.get(barcode_type.lower(), barcode.Code128)
+    barcode_class = _BARCODE_CLASSES.get(barcode_type, barcode.Code128)
+    strip_formatting = barcode_type in _NUMERIC_TYPES
+    uppercase = barcode_type == 'code39'
+    
+    # Handle text display options
+    use_custom_text = bool(custom_text_content and custom_text_content.strip()) and not hide_text
+    if hide_text:
+        # Hide text completely - set text_distance to 0 and create barcode without text
+        text_distance = 0
+    
+    writer_options = {
+        'module_width': module_width,
+        'module_height': module_height,
+        'quiet_zone': quiet_zone,
+        'text_distance': text_distance,
+        'font_size': font_size,
+        'write_text': not hide_text  # Control whether text is written or not
+    }
     
-    try:
-        # Store original text for decoding later
-        original_text = text
-        
-        # Prepare data for specific barcode types
-        barcode_data_text = text
-        
-        # Clean and format data for specific barcode types
-        if barcode_type.lower() in ['ean8', 'ean13', 'jan', 'upca', 'isbn10', 'isbn13', 'issn', 'pzn']:
-            # Remove formatting characters for numeric barcodes
-            barcode_data_text = text.replace('-', '').replace(' ', '')
-        
-        if barcode_type.lower() == 'code39':
-            # Code39 requires uppercase
-            barcode_data_text = text.upper()
-        
-        # Handle text display options
-        display_text = text  # Original text to display
-        if hide_text:
-            # Hide text completely - set text_distance to 0 and create barcode without text
-            text_distance = 0
-            display_text = ""
-        elif custom_text_content and custom_text_content.strip():
-            # Use custom text content
-            display_text = custom_text_content.strip()
-        
-        writer = ImageWriter()
-        writer.set_options({
-            'module_width': module_width,
-            'module_height': module_height,
-            'quiet_zone': quiet_zone,
-            'text_distance': text_distance if not hide_text else 0,
-            'font_size': font_size,
-            'write_text': not hide_text  # Control whether text is written or not
-        })
-        
-        # Generate barcode using the cleaned/formatted data
-        code = barcode_class(barcode_data_text, writer=writer)
-        
-        # Create an image from the barcode
-        buffer = io.BytesIO()
-        
-        if hide_text:
-            # Generate barcode without text
-            code.write(buffer, options={'write_text': False})
-        elif custom_text_content and custom_text_content.strip():
-            # Generate barcode without default text, we'll add custom text later
-            code.write(buffer, options={'write_text': False})
-        else:
-            # Generate barcode with default text
-            code.write(buffer)
-        
-        barcode_data = buffer.getvalue()
-        
-        # If custom text is specified and we're not hiding text, we need to modify the image
-        if custom_text_content and custom_text_content.strip() and not hide_text:
-            # Load the generated barcode image and add custom text
+    def run(data, encoding: str = "utf-8") -> str:
+        # Convert data to string if needed
+        if isinstance(data, bytes):
             try:
-                from PIL import Image, ImageDraw, ImageFont
-                
-                # Load the barcode image from buffer
-                barcode_img = Image.open(io.BytesIO(barcode_data))
-                
-                # Create a new image with extra space for custom text
-                img_width, img_height = barcode_img.size
-                text_height = int(font_size + text_distance + 10)  # Extra padding, convert to int
-                new_height = int(img_height + text_height)  # Convert to int
-                new_img = Image.new('RGB', (img_width, new_height), 'white')
-                
-                # Paste the original barcode
-                new_img.paste(barcode_img, (0, 0))
-                
-                # Add custom text
-                draw = ImageDraw.Draw(new_img)
-                # Improved font loading with better fallback chain
-                font = None
-                
-                # Get current directory for relative font paths
-                current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                fonts_dir = os.path.join(current_dir, "fonts")
-                
-                font_paths = [
-                    # FiraCode in project fonts directory (highest priority)
-                    os.path.join(fonts_dir, "FiraCode-Regular.ttf"),
-                    os.path.join(fonts_dir, "FiraCode.ttf"),
-                    os.path.join(fonts_dir, "firacode-regular.ttf"),
-                    # FiraCode system installations
-                    "FiraCode-Regular.ttf",
-                    "C:/Windows/Fonts/FiraCode-Regular.ttf",
-                    f"C:/Users/{os.environ.get('USERNAME', 'user')}/AppData/Local/Microsoft/Windows/Fonts/FiraCode-Regular.ttf",
-                    "FiraCode.ttf", 
-                    "C:/Windows/Fonts/FiraCode.ttf",
-                    "firacode",
-                    # Consolas (excellent monospace font on Windows)
-                    "C:/Windows/Fonts/consola.ttf",
-                    "consolas.ttf",
-                    "C:/Windows/Fonts/consolab.ttf",  # Bold version
-                    # Courier New (classic monospace)
-                    "C:/Windows/Fonts/cour.ttf",
-                    "C:/Windows/Fonts/courbd.ttf",
-                    "courier.ttf",
-                    # DejaVu Sans Mono (good cross-platform option)
-                    "DejaVuSansMono.ttf",
-                    "DejaVuSansMono-Bold.ttf",
-                    # Arial fallbacks
-                    "C:/Windows/Fonts/arial.ttf",
-                    "arial.ttf"
-                ]
-                
-                for font_path in font_paths:
-                    try:
-                        font = ImageFont.truetype(font_path, font_size)
-                        break
-                    except:
-                        continue
-                
-                # Final fallback to default font
-                if font is None:
-                    font = ImageFont.load_default()
-                
-                # Calculate text position (centered)
-                bbox = draw.textbbox((0, 0), custom_text_content, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_x = (img_width - text_width) // 2
-                text_y = int(img_height + text_distance)  # Convert to int
-                
-                draw.text((text_x, text_y), custom_text_content, fill='black', font=font)
-                
-                # Save the modified image back to buffer
-                buffer = io.BytesIO()
-                new_img.save(buffer, format='PNG')
-                barcode_data = buffer.getvalue()
-                
-            except Exception:
-                # If image manipulation fails, use original barcode
-                pass
+                # Try to decode the bytes to string 
+                text = data.decode(encoding, errors="replace")
+            except UnicodeDecodeError:
+                # If fails, use hex representation
+                text = data.hex()
+        else:
+            text = str(data)
         
-        # Return special format string with original text preserved
-        return f"BARCODE:{len(barcode_data)}:{barcode_data.hex()}:ORIGINAL:{original_text}"
+        # Validate data against barcode type
+        is_valid, error_message = validate_barcode_data(text, barcode_type)
+        if not is_valid:
+            raise ValueError(f"Data is not compatible with barcode type {barcode_type.upper()}:\n\n{error_message}")
         
-    except Exception as e:
-        # Re-raise the error for proper error handling
-        raise ValueError(f"Cannot create barcode {barcode_type.upper()}: {str(e)}")
+        try:
+            # Clean and format data for specific barcode types
+            barcode_data_text = text
+            if strip_formatting:
+                # Remove formatting characters for numeric barcodes
+                barcode_data_text = text.translate(_STRIP_FORMATTING)
+            if uppercase:
+                # Code39 requires uppercase
+                barcode_data_text = text.upper()
+            
+            # Writers keep per-render state, so each call (and thread) gets its own
+            writer = _build_writer(writer_options)
+            
+            # Generate barcode using the cleaned/formatted data
+            code = barcode_class(barcode_data_text, writer=writer)
+            
+            # Create an image from the barcode
+            buffer = io.BytesIO()
+            
+            if hide_text:
+                # Generate barcode without text
+                code.write(buffer, options={'write_text': False})
+            elif use_custom_text:
+                # Render without default text straight to a PIL image (no PNG round-trip),
+                # add the custom text, then encode PNG once
+                barcode_img = code.render(writer_options={'write_text': False})
+                try:
+                    barcode_img = _render_with_custom_text(barcode_img, custom_text_content, font_size, text_distance)
+                except Exception:
+                    # If image manipulation fails, use original barcode
+                    pass
+                barcode_img.save(buffer, format='PNG', compress_level=1)
+            else:
+                # Generate barcode with default text
+                code.write(buffer)
+            
+            # Base64-encode straight from the buffer's memory instead of copying it out with getvalue()
+            with buffer.getbuffer() as barcode_data:
+                # Return special format string with original text preserved
+                return format_barcode_image(barcode_data, text)
+            
+        except Exception as e:
+            # Re-raise the error for proper error handling
+            raise ValueError(f"Cannot create barcode {barcode_type.upper()}: {str(e)}")
+    
+    return run
 
 def decode(text: str, encoding: str = "utf-8") -> bytes:
     """
@@ -389,31 +554,33 @@ def decode(text: str, encoding: str = "utf-8") -> bytes:
     :return: Decoded data from barcode as bytes
     """
     # Check if the text starts with our special prefix
-    if not text.startswith("BARCODE:"):
+    if not text.startswith((BARCODE_PREFIX, LEGACY_BARCODE_PREFIX)):
         raise ValueError("Invalid barcode format")
     
     # Check if this is the new format with original text preserved
-    if ":ORIGINAL:" in text:
-        # New format: BARCODE:length:hex_data:ORIGINAL:original_text
-        parts = text.split(':ORIGINAL:', 1)
-        if len(parts) == 2:
-            # Return the original text as bytes
-            original_text = parts[1]
-            return original_text.encode(encoding)
+    original_at = text.find(_ORIGINAL_MARKER)
+    if original_at != -1:
+        # New format: BARCODE2:length:base64_data:ORIGINAL:original_text
+        # Return the original text as bytes
+        return text[original_at + len(_ORIGINAL_MARKER):].encode(encoding)
     
     # Old format or fallback: extract and decode the barcode image
-    parts = text.split(':', 3)  # Allow for more parts in case of new format
-    if len(parts) < 3:
+    field = _image_field(text)
+    if field is None:
         raise ValueError("Invalid barcode format")
     
-    # Convert hex back to binary
-    barcode_data = bytes.fromhex(parts[2])
+    # Convert base64/hex back to binary
+    barcode_data = _payload_to_bytes(*field)
+    if barcode_data is None:
+        raise ValueError("Invalid barcode format")
     
-    # Load image from binary data
-    img = Image.open(io.BytesIO(barcode_data))
+    # Load image from binary data as 8-bit grayscale (1 byte/pixel for the scanner)
+    img = Image.open(io.BytesIO(barcode_data)).convert('L')
     
-    # Decode barcode
-    decoded_objects = pyzbar.decode(img)
+    # Decode barcode from the raw (pixels, width, height) buffer. Strings from encode()
+    # return their ORIGINAL text above, so images reaching this point are user-supplied
+    # PNGs of unknown symbology: scan with every decoder ZBar enables by default
+    decoded_objects = pyzbar.decode((img.tobytes(), img.width, img.height))
     if not decoded_objects:
         raise ValueError("No barcode found in the image")
     
@@ -485,6 +652,38 @@ def reverse_barcode_formatting(decoded_text: str, barcode_format: str) -> str:
     # Default: return the decoded text as-is
     return decoded_text
 
+def get_barcode_image_bytes(text: str):
+    """
+    Extract the PNG image bytes from the special format string.
+    
+    :param text: Special format string containing barcode image data
+    :return: PNG image bytes, or None if the string is malformed
+    """
+    # BARCODE2:length:base64_data[:ORIGINAL:original_text] (or legacy BARCODE:length:hex_data)
+    field = _image_field(text)
+    if field is None:
+        return None
+    
+    # Convert base64/hex back to binary
+    return _payload_to_bytes(*field)
+
+def encode_many(items, encoding: str = "utf-8", max_workers: int = None) -> list:
+    """
+    Encode several barcodes concurrently (PIL and libpng release the GIL while rendering).
+    
+    :param items: Iterable of (data, options) pairs; options are the encode() keyword arguments
+    :param encoding: String encoding if data is bytes
+    :param max_workers: Worker thread count (defaults to the CPU count, capped at 32)
+    :return: List of special format strings, in the same order as items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [encode(data, encoding, **options) for data, options in items]
+    
+    workers = max_workers or min(32, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: encode(item[0], encoding, **item[1]), items))
+
 def save_barcode_image(text: str, output_path: str) -> bool:
     """
     Save the barcode image to a file.
@@ -494,23 +693,18 @@ def save_barcode_image(text: str, output_path: str) -> bool:
     :return: True if successful, False otherwise
     """
     try:
-        # Handle new format with original text
-        if ":ORIGINAL:" in text:
-            # New format: BARCODE:length:hex_data:ORIGINAL:original_text
-            parts = text.split(':ORIGINAL:', 1)[0].split(':')
-        else:
-            # Old format: BARCODE:length:hex_data
-            parts = text.split(':')
-        
-        if len(parts) < 3:
+        barcode_data = get_barcode_image_bytes(text)
+        if barcode_data is None:
             return False
         
-        # Convert hex back to binary
-        barcode_data = bytes.fromhex(parts[2])
-        
-        # Write to file
-        with open(output_path, 'wb') as f:
-            f.write(barcode_data)
+        # Write to file through a raw descriptor (no BufferedWriter copy)
+        fd = os.open(output_path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(barcode_data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         
         return True
     except Exception:
@@ -11,6 +11,20 @@ BASE91_ALPHABET = [
     '>', '?', '@', '[', ']', '^', '_', '`', '{', '|', '}', '~', '"'
 ]
 
+# Both characters for every 13-bit value (a group never exceeds 8191 < 91^2)
+_PAIRS = tuple(BASE91_ALPHABET[v // 91] + BASE91_ALPHABET[v % 91] for v in range(8192))
+
+# 13 bytes are exactly 8 groups of 13 bits, so whole blocks leave no bits queued
+_BLOCK_BYTES = 13
+_BLOCK_MASK = (1 << 8 * _BLOCK_BYTES) - 1
+
+# bytes.translate table: ASCII code -> alphabet index, 0xFF for characters outside the alphabet
+_DECODE_TABLE = bytearray(b'\xff' * 256)
+for _i, _char in enumerate(BASE91_ALPHABET):
+    _DECODE_TABLE[ord(_char)] = _i
+_DECODE_TABLE = bytes(_DECODE_TABLE)
+del _i, _char
+
 
 def encode(data: bytes, encoding: str = "utf-8") -> str:
     """
@@ -23,8 +37,19 @@ def encode(data: bytes, encoding: str = "utf-8") -> str:
     result = []
     queue = 0
     bits = 0
+    pairs = _PAIRS
+    
+    # Bytes are queued least significant first, so a little-endian block holds
+    # its 8 groups in output order; look each one up as a ready-made pair
+    full = len(data) - len(data) % _BLOCK_BYTES
+    from_bytes = int.from_bytes
+    for i in range(0, full, _BLOCK_BYTES):
+        x = from_bytes(data[i:i + _BLOCK_BYTES], 'little')
+        result += (pairs[x & 8191], pairs[(x >> 13) & 8191], pairs[(x >> 26) & 8191],
+                   pairs[(x >> 39) & 8191], pairs[(x >> 52) & 8191], pairs[(x >> 65) & 8191],
+                   pairs[(x >> 78) & 8191], pairs[x >> 91])
     
-    for byte in data:
+    for byte in data[full:]:
         queue |= byte << bits
         bits += 8
         
@@ -32,9 +57,7 @@ def encode(data: bytes, encoding: str = "utf-8") -> str:
             val = queue & 8191  # 0b1111111111111 (13 bits)
             
             # Encode as two Base91 characters
-            quotient, remainder = divmod(val, 91)
-            result.append(BASE91_ALPHABET[quotient])
-            result.append(BASE91_ALPHABET[remainder])
+            result.append(pairs[val])
             
             queue >>= 13
             bits -= 13
@@ -59,24 +82,42 @@ def decode(text: str, encoding: str = "utf-8") -> bytes:
     :param encoding: String encoding (not used in actual decoding)
     :return: Decoded binary data
     """
-    # Create a reverse mapping from character to value
-    char_to_val = {char: i for i, char in enumerate(BASE91_ALPHABET)}
+    # Map every character to its alphabet index in one C-level pass
+    try:
+        vals = text.encode('ascii').translate(_DECODE_TABLE)
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Invalid Base91 character: {text[e.start]}")
+    invalid = vals.find(0xFF)
+    if invalid != -1:
+        raise ValueError(f"Invalid Base91 character: {text[invalid]}")
     
     result = bytearray()
     queue = 0
     bits = 0
     value = -1
     
-    for char in text:
-        if char not in char_to_val:
-            raise ValueError(f"Invalid Base91 character: {char}")
-            
+    # 16 characters are 8 pairs of 13 bits = 13 whole bytes; bits of a pair value
+    # above 8191 carry over into the next block just like in the pair loop below
+    full = len(vals) - len(vals) % 16
+    for i in range(0, full, 16):
+        queue |= ((vals[i] * 91 + vals[i + 1])
+                  | (vals[i + 2] * 91 + vals[i + 3]) << 13
+                  | (vals[i + 4] * 91 + vals[i + 5]) << 26
+                  | (vals[i + 6] * 91 + vals[i + 7]) << 39
+                  | (vals[i + 8] * 91 + vals[i + 9]) << 52
+                  | (vals[i + 10] * 91 + vals[i + 11]) << 65
+                  | (vals[i + 12] * 91 + vals[i + 13]) << 78
+                  | (vals[i + 14] * 91 + vals[i + 15]) << 91)
+        result += (queue & _BLOCK_MASK).to_bytes(_BLOCK_BYTES, 'little')
+        queue >>= 8 * _BLOCK_BYTES
+    
+    for val in vals[full:]:
         # First value in pair or single remaining character
         if value == -1:
-            value = char_to_val[char]
+            value = val
         # Second value in pair
         else:
-            value = value * 91 + char_to_val[char]
+            value = value * 91 + val
             queue |= value << bits
             bits += 13  # Two Base91 characters represent 13 bits
             
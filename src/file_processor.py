@@ -323,7 +323,7 @@ class ChunkProcessor:
                         self.progress_handler.update_progress(processed_size, file_size)
                 
                 # Create the special BARCODE format that barcode_mode.decode expects
-                data_str = f"BARCODE:{len(png_data)}:{png_data.hex()}"
+                data_str = barcode_mode.format_barcode_image(png_data)
                 
             elif is_image_mode and file_path.lower().endswith('.png'):
                 # This is a PNG file being decoded as image
@@ -541,11 +541,11 @@ class ChunkProcessor:
                 self.progress_handler.update_progress(75, 100)
                 self.progress_handler.update_additional_status("Decoding barcode data...")
             
-            # Create barcode format string
-            barcode_format = f"BARCODE:{len(png_data)}:{png_data.hex()}"
-            
             # Import barcode mode and decode
             from src import barcode_mode
+            
+            # Create barcode format string
+            barcode_format = barcode_mode.format_barcode_image(png_data)
             decoded_bytes = barcode_mode.decode(barcode_format)
             
             # Update progress to completion
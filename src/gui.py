@@ -1199,10 +1199,6 @@ def start_gui():
                         widget.bind("<Leave>", hide_tooltip)
                         widget.bind("<Button-1>", handle_help_button_click)  # Modified to handle Konami sequence
                         
-                        # Bind key events to the tooltip button for Konami code
-                        widget.bind("<KeyPress>", admin.handle_key_press_event, add='+')
-                        widget.bind("<KeyRelease>", admin.handle_key_release_event, add='+')
-                        
                         # Hide tooltip when clicking elsewhere in the application
                         widget.winfo_toplevel().bind("<Button-1>", hide_on_focus_out, add="+")
                     
@@ -1821,22 +1817,9 @@ def start_gui():
     admin.init_debug_system(root)
     
     # Setup Konami code listener on the root window
-    # Make root window focusable to receive key events
-    root.focus_set()
-    root.bind("<KeyPress>", admin.handle_key_press_event)
-    root.bind("<KeyRelease>", admin.handle_key_release_event)
-    
-    # Also bind to all child widgets to capture key events from anywhere
-    def bind_konami_to_all_children(widget):
-        try:
-            for child in widget.winfo_children():
-                child.bind("<KeyPress>", admin.handle_key_press_event, add='+')
-                child.bind("<KeyRelease>", admin.handle_key_release_event, add='+')
-                bind_konami_to_all_children(child)
-        except:
-            pass  # Skip widgets that don't support binding
-    
-    bind_konami_to_all_children(root)
+    # Key events from every child reach the root's bindtag; the handler binds
+    # them only while it is listening for the sequence
+    admin.setup_konami_code_listener(root)
     
     # Log debug message for initialization
     admin.log_debug_message("GUI initialized with Konami code listener")